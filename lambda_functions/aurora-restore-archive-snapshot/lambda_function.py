@@ -3,13 +3,25 @@
 Lambda function to archive a snapshot after a successful restore.
 """
 
-import time
 from typing import Dict, Any, Optional, Tuple
 
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
 from utils.base_handler import BaseHandler
 from utils.common import logger
 from utils.validation import validate_required_params, validate_region
 from utils.aws_utils import get_client, handle_aws_error
+from utils.state_utils import load_state, save_state
+
+# Bound RDS call latency instead of the 60s botocore defaults, and keep
+# connections alive so warm containers skip NAT idle-reap reconnects.
+_RDS_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    retries={'mode': 'adaptive', 'max_attempts': 3},
+    tcp_keepalive=True
+)
 
 class ArchiveSnapshotHandler(BaseHandler):
     """Handler for archiving a snapshot after a successful restore."""
@@ -18,40 +30,50 @@ class ArchiveSnapshotHandler(BaseHandler):
         """Initialize the archive snapshot handler."""
         super().__init__('archive_snapshot')
         self.rds_client = None
-    
+        self.rds_client_region = None
+        self._config_validated = False
+
     def validate_config(self) -> None:
         """
         Validate required configuration parameters.
         
+        Config comes from environment variables that are fixed for the life
+        of the container, so a successful validation is remembered and warm
+        invocations skip the re-check.
+
         Raises:
             ValueError: If required parameters are missing or invalid
         """
+        if self._config_validated:
+            return
+
         required_params = {
             'target_region': self.config.get('target_region')
         }
-        
+
         missing_params = validate_required_params(required_params)
         if missing_params:
             raise ValueError(f"Missing required parameters: {', '.join(missing_params)}")
-        
+
         if not validate_region(self.config['target_region']):
             raise ValueError(f"Invalid target region: {self.config['target_region']}")
+
+        self._config_validated = True
     
-    def get_snapshot_details(self, event: Dict[str, Any]) -> Tuple[str, str]:
+    def get_snapshot_details(self, event: Dict[str, Any], state: Dict[str, Any]) -> Tuple[str, str]:
         """
         Get snapshot details from event or state.
-        
+
         Args:
             event: Lambda event
-            
+            state: Previously loaded operation state
+
         Returns:
             Tuple[str, str]: Target snapshot name and region
-            
+
         Raises:
             ValueError: If snapshot details are missing
         """
-        state = self.load_state()
-        
         target_snapshot_name = state.get('target_snapshot_name')
         target_region = (
             state.get('target_region') or 
@@ -70,53 +92,39 @@ class ArchiveSnapshotHandler(BaseHandler):
     def initialize_rds_client(self, region: str) -> None:
         """
         Initialize RDS client for target region.
-        
+
+        The client is cached per region at module scope by get_client, so warm
+        invocations reuse the same client instead of rebuilding the credential
+        chain and TLS context on every call.
+
         Args:
             region: AWS region
-            
+
         Raises:
             Exception: If client initialization fails
         """
+        if self.rds_client is not None and self.rds_client_region == region:
+            return
+
         try:
-            self.rds_client = get_client('rds', region_name=region)
+            self.rds_client = get_client('rds', region_name=region, config=_RDS_CONFIG)
+            self.rds_client_region = region
         except Exception as e:
             raise Exception(f"Failed to create RDS client for region {region}: {str(e)}")
     
-    def check_snapshot_exists(self, snapshot_name: str) -> bool:
-        """
-        Check if the snapshot exists.
-        
-        Args:
-            snapshot_name: Name of the snapshot to check
-            
-        Returns:
-            bool: True if snapshot exists, False otherwise
-            
-        Raises:
-            Exception: If check fails
+    def delete_snapshot(self, snapshot_name: str) -> bool:
         """
-        try:
-            logger.info(f"Checking if snapshot {snapshot_name} exists")
-            response = self.rds_client.describe_db_cluster_snapshots(
-                DBClusterSnapshotIdentifier=snapshot_name
-            )
-            
-            return bool(response.get('DBClusterSnapshots'))
-            
-        except Exception as e:
-            if 'DBClusterSnapshotNotFoundFault' in str(e):
-                logger.info(f"Snapshot {snapshot_name} does not exist")
-                return False
-            handle_aws_error(e, self.operation_id, self.step_name)
-            raise
-    
-    def delete_snapshot(self, snapshot_name: str) -> None:
-        """
-        Delete the snapshot.
-        
+        Delete the snapshot optimistically.
+
+        The delete call itself reports a missing snapshot, so no separate
+        describe round-trip is needed beforehand.
+
         Args:
             snapshot_name: Name of the snapshot to delete
-            
+
+        Returns:
+            bool: True if the snapshot was deleted, False if it did not exist
+
         Raises:
             Exception: If deletion fails
         """
@@ -125,31 +133,34 @@ class ArchiveSnapshotHandler(BaseHandler):
             self.rds_client.delete_db_cluster_snapshot(
                 DBClusterSnapshotIdentifier=snapshot_name
             )
-        except Exception as e:
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') == 'DBClusterSnapshotNotFoundFault':
+                logger.info(f"Snapshot {snapshot_name} does not exist")
+                return False
             handle_aws_error(e, self.operation_id, self.step_name)
             raise
     
-    def handle_snapshot_not_found(self, snapshot_name: str, region: str) -> Dict[str, Any]:
+    def handle_snapshot_not_found(self, state: Dict[str, Any], snapshot_name: str, region: str) -> Dict[str, Any]:
         """
         Handle case where snapshot is not found.
-        
+
         Args:
+            state: In-memory operation state to update
             snapshot_name: Name of the snapshot
             region: AWS region
-            
+
         Returns:
             Dict[str, Any]: Response
         """
-        # Update state
-        state = {
+        # Update state in memory; process() persists it once at the end
+        state.update({
             'target_snapshot_name': snapshot_name,
             'target_region': region,
             'archive_status': 'skipped',
             'success': True
-        }
-        
-        self.save_state(state)
-        
+        })
+
         return {
             'message': f"Snapshot {snapshot_name} does not exist, no action needed",
             'target_snapshot_name': snapshot_name,
@@ -157,27 +168,26 @@ class ArchiveSnapshotHandler(BaseHandler):
             'archive_status': 'skipped'
         }
     
-    def handle_snapshot_deleted(self, snapshot_name: str, region: str) -> Dict[str, Any]:
+    def handle_snapshot_deleted(self, state: Dict[str, Any], snapshot_name: str, region: str) -> Dict[str, Any]:
         """
         Handle case where snapshot is successfully deleted.
-        
+
         Args:
+            state: In-memory operation state to update
             snapshot_name: Name of the snapshot
             region: AWS region
-            
+
         Returns:
             Dict[str, Any]: Response
         """
-        # Update state
-        state = {
+        # Update state in memory; process() persists it once at the end
+        state.update({
             'target_snapshot_name': snapshot_name,
             'target_region': region,
             'archive_status': 'deleted',
             'success': True
-        }
-        
-        self.save_state(state)
-        
+        })
+
         return {
             'message': f"Snapshot {snapshot_name} deleted successfully",
             'target_snapshot_name': snapshot_name,
@@ -196,52 +206,51 @@ class ArchiveSnapshotHandler(BaseHandler):
         Returns:
             dict: Processing result
         """
-        start_time = time.time()
-        
-        try:
-            # Validate configuration
-            self.validate_config()
-            
-            # Get snapshot details
-            target_snapshot_name, target_region = self.get_snapshot_details(event)
-            
-            # Initialize RDS client
-            self.initialize_rds_client(target_region)
-            
-            # Check if snapshot exists
-            snapshot_exists = self.check_snapshot_exists(target_snapshot_name)
-            
-            if not snapshot_exists:
-                result = self.handle_snapshot_not_found(target_snapshot_name, target_region)
-                
-                # Update metrics
-                duration = time.time() - start_time
-                self.update_metrics('archive_snapshot_duration', duration, 'Seconds')
-                
-                return result
-            
-            # Delete the snapshot
-            self.delete_snapshot(target_snapshot_name)
-            
-            result = self.handle_snapshot_deleted(target_snapshot_name, target_region)
-            
-            # Update metrics
-            duration = time.time() - start_time
-            self.update_metrics('archive_snapshot_duration', duration, 'Seconds')
-            
-            return result
-            
-        except Exception as e:
-            # Update metrics for failure
-            duration = time.time() - start_time
-            self.update_metrics('archive_snapshot_duration', duration, 'Seconds')
-            self.update_metrics('archive_snapshot_failures', 1, 'Count')
-            
-            raise
+        # Duration and failure metrics are emitted centrally by
+        # BaseHandler.execute, so exceptions propagate without re-handling
+
+        # Validate configuration
+        self.validate_config()
+
+        # Load state once; it is mutated in memory and written back once
+        state = load_state(self.operation_id)
+        prior_state = dict(state)
+
+        # Get snapshot details
+        target_snapshot_name, target_region = self.get_snapshot_details(event, state)
+
+        # Initialize RDS client
+        self.initialize_rds_client(target_region)
+
+        # Delete the snapshot; a missing snapshot is the "skipped" path
+        snapshot_deleted = self.delete_snapshot(target_snapshot_name)
+
+        if snapshot_deleted:
+            result = self.handle_snapshot_deleted(state, target_snapshot_name, target_region)
+        else:
+            result = self.handle_snapshot_not_found(state, target_snapshot_name, target_region)
+
+        # Persist the merged state, skipping the write when nothing
+        # changed (idempotent retries re-land on the same archive_status)
+        if state != prior_state:
+            save_state(self.operation_id, state)
+
+        return result
 
 # Initialize handler
 handler = ArchiveSnapshotHandler()
 
+# Warm up the RDS client at init time so endpoint resolution and client
+# construction happen during the init phase (and are captured by SnapStart
+# snapshots) instead of on the first invocation.
+try:
+    _warm_region = handler.config.get('target_region')
+    if _warm_region:
+        _ = get_client('rds', region_name=_warm_region, config=_RDS_CONFIG).meta.endpoint_url
+except Exception:
+    # Warm-up is best-effort; the first invocation will build the client.
+    pass
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for archiving a snapshot after a successful restore.
@@ -3,9 +3,13 @@
 Lambda function to check the status of a snapshot copy operation.
 """
 
-import json
+import random
 import time
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, List, Optional, Tuple
+
+from botocore.config import Config
 
 from utils.base_handler import BaseHandler
 from utils.common import logger
@@ -13,6 +17,155 @@ from utils.validation import validate_required_params, validate_region, validate
 from utils.aws_utils import get_client, handle_aws_error
 from utils.state_utils import trigger_next_step
 
+# Polling describes are fast control-plane reads: fail fast and let the
+# orchestrator's wait/retry loop absorb transient API slowdowns instead
+# of burning Lambda time on botocore's 60s default timeouts.
+_POLL_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'mode': 'adaptive', 'max_attempts': 2},
+    tcp_keepalive=True
+)
+
+# Executor that lets telemetry writes (state/audit transaction, metrics)
+# overlap with the request-path round-trips instead of running serially.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Futures for in-flight telemetry writes. Drained before every return so
+# the Lambda runtime is never frozen mid-write.
+_pending: List[Any] = []
+
+def _submit_telemetry(fn, *args, **kwargs) -> None:
+    """
+    Queue a telemetry write on the background executor.
+
+    Args:
+        fn: Callable performing the write
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+    """
+    _pending.append(_IO_EXECUTOR.submit(fn, *args, **kwargs))
+
+def _drain() -> None:
+    """Wait for queued telemetry writes to land, then clear the queue."""
+    if _pending:
+        wait(_pending, timeout=3)
+        _pending.clear()
+
+# Last state written per operation. Polls where the snapshot status did
+# not move skip the DynamoDB write entirely; only the changed polls pay
+# for a transaction.
+_LAST_PERSISTED: Dict[str, Dict[str, Any]] = {}
+
+# Snapshot-status cache shared across in-flight copies: one paginated
+# describe per region per TTL window serves every lookup instead of one
+# describe call per snapshot per invocation.
+_SNAPSHOT_CACHE_TTL = 10  # seconds
+_SNAPSHOT_CACHE: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+
+# Snapshot status carried directly in EventBridge RDS snapshot events;
+# event-driven invocations can read it instead of calling describe.
+_RDS_EVENT_STATUS = {
+    'RDS-EVENT-0075': 'available',   # snapshot copy finished
+    'RDS-EVENT-0076': 'failed'       # snapshot copy failed
+}
+
+def _status_from_event(event: Dict[str, Any]) -> Optional[str]:
+    """
+    Extract the snapshot status from an EventBridge RDS event.
+
+    Args:
+        event: Lambda event
+
+    Returns:
+        Optional[str]: Snapshot status, or None when the event is not a
+        recognized RDS snapshot event
+    """
+    if event.get('source') == 'aws.rds' and event.get('detail-type') == 'RDS DB Cluster Snapshot Event':
+        return _RDS_EVENT_STATUS.get(event.get('detail', {}).get('EventID'))
+    return None
+
+# How long to give the first describe before hedging with a duplicate.
+# Tuned near the call's p50 so only genuine stragglers pay for a second
+# request.
+_HEDGE_DELAY = 0.4  # seconds
+
+def _hedged_describe(rds_client, **kwargs) -> Dict[str, Any]:
+    """
+    Describe cluster snapshots with a hedged duplicate request.
+
+    If the first describe has not returned within _HEDGE_DELAY, a second
+    identical call is issued and whichever finishes first wins, trimming
+    the occasional multi-second backend straggler out of the p99.
+
+    Args:
+        rds_client: RDS client to call
+        **kwargs: Arguments for describe_db_cluster_snapshots
+
+    Returns:
+        Dict[str, Any]: The describe response
+    """
+    futures = [_IO_EXECUTOR.submit(rds_client.describe_db_cluster_snapshots, **kwargs)]
+    done, _ = wait(futures, timeout=_HEDGE_DELAY)
+
+    if not done:
+        futures.append(_IO_EXECUTOR.submit(rds_client.describe_db_cluster_snapshots, **kwargs))
+        done, _ = wait(futures, return_when=FIRST_COMPLETED)
+
+    winner = next(iter(done))
+    for future in futures:
+        if future is not winner:
+            future.cancel()
+
+    return winner.result()
+
+def _describe_snapshots_cached(rds_client, region: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Describe all manual cluster snapshots in a region, cached for a short TTL.
+
+    Args:
+        rds_client: RDS client for the region
+        region: AWS region the client belongs to
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Snapshot details keyed by identifier and ARN
+    """
+    now = time.monotonic()
+    cached = _SNAPSHOT_CACHE.get(region)
+    if cached and now - cached[0] < _SNAPSHOT_CACHE_TTL:
+        return cached[1]
+
+    snapshots = {}
+    paginator = rds_client.get_paginator('describe_db_cluster_snapshots')
+    for page in paginator.paginate(SnapshotType='manual'):
+        for snapshot in page['DBClusterSnapshots']:
+            snapshots[snapshot['DBClusterSnapshotIdentifier']] = snapshot
+            snapshots[snapshot['DBClusterSnapshotArn']] = snapshot
+
+    _SNAPSHOT_CACHE[region] = (now, snapshots)
+    return snapshots
+
+# Plain dataclass: slots=True needs Python 3.10 and the deployed
+# runtime is python3.9
+@dataclass
+class CopyStatusState:
+    """Copy-status state for one invocation; serialized to a dict once."""
+    source_snapshot_name: Optional[str]
+    source_snapshot_arn: Optional[str]
+    target_snapshot_name: Optional[str]
+    target_snapshot_arn: Optional[str]
+    copy_status: str
+    status: str
+    success: bool
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to the dict shape save_state/trigger_next_step expect."""
+        data = asdict(self)
+        if data['error'] is None:
+            del data['error']
+        return data
+
 class CheckCopyStatusHandler(BaseHandler):
     """Handler for checking snapshot copy status."""
     
@@ -20,6 +173,7 @@ class CheckCopyStatusHandler(BaseHandler):
         """Initialize the check copy status handler."""
         super().__init__('check_copy_status')
         self.rds_client = None
+        self.rds_client_region = None
     
     def validate_config(self) -> None:
         """
@@ -65,13 +219,16 @@ class CheckCopyStatusHandler(BaseHandler):
         """
         Initialize RDS client for target region.
         
-        Raises:
-            ValueError: If target region is not set
+        The client is cached per region by get_client, so warm invocations
+        reuse the existing client instead of rebuilding it. validate_config
+        has already guaranteed target_region is present and valid.
         """
-        if not self.config.get('target_region'):
-            raise ValueError("Target region is required")
-        
-        self.rds_client = get_client('rds', self.config['target_region'])
+        region = self.config['target_region']
+        if self.rds_client is not None and self.rds_client_region == region:
+            return
+
+        self.rds_client = get_client('rds', region, config=_POLL_CONFIG)
+        self.rds_client_region = region
     
     def check_copy_status(self, snapshot_arn: str) -> Dict[str, Any]:
         """
@@ -87,13 +244,26 @@ class CheckCopyStatusHandler(BaseHandler):
             Exception: If status check fails
         """
         try:
-            response = self.rds_client.describe_db_cluster_snapshots(
-                DBClusterSnapshotIdentifier=snapshot_arn
+            # Serve the lookup from the shared per-region cache so parallel
+            # restores share one paginated describe per TTL window
+            snapshot = _describe_snapshots_cached(
+                self.rds_client, self.rds_client_region
+            ).get(snapshot_arn)
+            if snapshot is not None:
+                return snapshot
+
+            # Fall back to a direct lookup, hedged against stragglers.
+            # IncludeShared lets one call cover manual and shared
+            # snapshots instead of retrying the describe per snapshot type.
+            response = _hedged_describe(
+                self.rds_client,
+                DBClusterSnapshotIdentifier=snapshot_arn,
+                IncludeShared=True
             )
-            
+
             if not response['DBClusterSnapshots']:
                 raise ValueError(f"Snapshot {snapshot_arn} not found")
-            
+
             return response['DBClusterSnapshots'][0]
         except Exception as e:
             handle_aws_error(e, f"Error checking copy status for {snapshot_arn}")
@@ -110,34 +280,163 @@ class CheckCopyStatusHandler(BaseHandler):
             Dict[str, Any]: Response
         """
         # If regions are the same, the copy is already complete
-        state_data = {
-            'source_snapshot_name': event.get('source_snapshot_name'),
-            'source_snapshot_arn': event.get('source_snapshot_arn'),
+        state_data = CopyStatusState(
+            source_snapshot_name=event.get('source_snapshot_name'),
+            source_snapshot_arn=event.get('source_snapshot_arn'),
+            target_snapshot_name=event.get('target_snapshot_name'),
+            target_snapshot_arn=event.get('target_snapshot_arn'),
+            copy_status='available',
+            status='completed',
+            success=True
+        ).to_dict()
+
+
+        # Persist state + audit in the background so the write overlaps
+        # the next-step invoke; drained before returning
+        _submit_telemetry(self.persist, self.operation_id, dict(state_data), 'SUCCESS', {
             'target_snapshot_name': event.get('target_snapshot_name'),
-            'target_snapshot_arn': event.get('target_snapshot_arn'),
-            'copy_status': 'available',
-            'status': 'completed',
-            'success': True
-        }
-        
-        # Save state
-        self.save_state(state_data)
-        
+            'copy_status': 'available'
+        }, 'copy_status_check')
+
         # Trigger next step
         trigger_next_step(
             self.operation_id,
             'delete_rds',
             state_data
         )
-        
-        return {
-            'message': 'No need to copy snapshot, regions are the same',
-            'snapshot_name': event.get('target_snapshot_name'),
+
+        _drain()
+
+        return self._status_response(
+            self.operation_id, 'No need to copy snapshot, regions are the same',
+            event.get('target_snapshot_name'), 'delete_rds'
+        )
+    
+    def _status_response(self, operation_id: str, message: str, snapshot_name: Optional[str], next_step: Optional[str], status_code: int = 200, **extra: Any) -> Dict[str, Any]:
+        """
+        Build the response shape shared by every status branch.
+
+        All branches return the same message/snapshot/region/next_step
+        body; centralizing it here keeps the branch methods down to their
+        actual side effects.
+
+        Args:
+            operation_id: Operation ID
+            message: Human-readable status message
+            snapshot_name: Target snapshot name
+            next_step: Next workflow step, or None when terminal
+            status_code: HTTP status code
+            **extra: Additional branch-specific fields
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        data = {
+            'message': message,
+            'snapshot_name': snapshot_name,
             'source_region': self.config.get('source_region'),
             'target_region': self.config.get('target_region'),
-            'next_step': 'delete_rds'
+            'next_step': next_step
         }
-    
+        data.update(extra)
+        return self.create_response(operation_id, data, status_code)
+
+    def _handle_copy_complete(self, operation_id: str, event: Dict[str, Any], state_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a completed copy: trigger delete_rds and respond.
+
+        Args:
+            operation_id: Operation ID
+            event: Lambda event
+            state_data: State already persisted for this check
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        trigger_next_step(operation_id, 'delete_rds', state_data)
+
+        # Terminal state: drop the persisted-state memo for this operation
+        _LAST_PERSISTED.pop(operation_id, None)
+
+        return self._status_response(
+            operation_id, 'Snapshot copy completed',
+            event.get('target_snapshot_name'), 'delete_rds'
+        )
+
+    def _handle_copy_failed(self, operation_id: str, event: Dict[str, Any], state_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle a failed copy: persist the failure and respond with 500.
+
+        Args:
+            operation_id: Operation ID
+            event: Lambda event
+            state_data: State already persisted for this check
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        error_message = f"Snapshot copy failed: {state_data['copy_status']}"
+        logger.error(error_message)
+
+        # Update state with failure
+        state_data['status'] = 'failed'
+        state_data['success'] = False
+        state_data['error'] = error_message
+
+        # Persist failed state + audit in one transaction; the snapshot
+        # names are already bound in state_data, no need to re-read event
+        self.persist(operation_id, state_data, 'FAILED', {
+            'source_snapshot_name': state_data.get('source_snapshot_name'),
+            'target_snapshot_name': state_data.get('target_snapshot_name'),
+            'error': error_message
+        }, 'copy_failure')
+
+        _LAST_PERSISTED.pop(operation_id, None)
+
+        return self._status_response(
+            operation_id, error_message,
+            event.get('target_snapshot_name'), None, 500
+        )
+
+    def _handle_copy_in_progress(self, operation_id: str, event: Dict[str, Any], state_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle an in-progress copy.
+
+        The next check is driven from outside: either the EventBridge
+        rule on the RDS snapshot-available event (RDS-EVENT-0075) or an
+        orchestrator honoring the advisory backoff. The handler never
+        re-invokes itself — an async self-invoke delivers immediately,
+        which would turn the poll into a tight check/re-invoke loop.
+
+        Args:
+            operation_id: Operation ID
+            event: Lambda event
+            state_data: State already persisted for this check
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        # Advisory backoff for orchestrators: a Step Functions Wait state
+        # can read wait_seconds (SecondsPath) before re-running the check.
+        # Jitter desynchronizes polls from operations that started
+        # together so they do not hammer RDS in lockstep.
+        attempt = event.get('poll_attempt', 0)
+        wait_seconds = min(300, 15 * (2 ** attempt)) + random.randint(0, 5)
+
+        return self._status_response(
+            operation_id, 'Snapshot copy in progress',
+            event.get('target_snapshot_name'), None,
+            wait_seconds=wait_seconds,
+            poll_attempt=attempt + 1
+        )
+
+    # Status dispatch table; unknown statuses fall back to in-progress
+    _STATUS_DISPATCH = {
+        'available': _handle_copy_complete,
+        'failed': _handle_copy_failed,
+        'copying': _handle_copy_in_progress
+    }
+
     def process(self, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         """
         Process the Lambda event.
@@ -152,126 +451,110 @@ class CheckCopyStatusHandler(BaseHandler):
         try:
             # Get operation ID
             operation_id = self.get_operation_id(event)
-            
+
+            # Idempotency: a retried or replayed event for a copy that
+            # already finished skips validation, client init and the
+            # describe, and just hands off to the next step
+            if event.get('copy_status') == 'available':
+                trigger_next_step(operation_id, 'delete_rds', dict(event))
+
+                return self._status_response(
+                    operation_id, 'Snapshot copy already completed',
+                    event.get('target_snapshot_name'), 'delete_rds'
+                )
+
+            # Bind repeated config/event lookups once
+            source_region = self.config.get('source_region')
+            target_region = self.config.get('target_region')
+            source_snapshot_name = event.get('source_snapshot_name')
+            target_snapshot_name = event.get('target_snapshot_name')
+
+            # Same-region runs never copied anything, so there is no status
+            # to check: short-circuit before validation and client init
+            if source_region and source_region == target_region:
+                return self.handle_same_region_case(event)
+
             # Validate configuration
             self.validate_config()
-            
+
             # Validate snapshot parameters
             self.validate_snapshot_params(event)
-            
-            # Check if source and target regions are the same
-            if self.config.get('source_region') == self.config.get('target_region'):
-                return self.handle_same_region_case(event)
-            
-            # Initialize RDS client
-            self.initialize_rds_client()
-            
-            # Check copy status
-            snapshot_details = self.check_copy_status(event['target_snapshot_arn'])
-            
+
+            # EventBridge RDS events already carry the snapshot status;
+            # only fall back to the describe call for polled invocations
+            status = _status_from_event(event)
+            if status is None:
+                self.initialize_rds_client()
+
+                # Extract the status string once for every consumer below
+                # instead of re-indexing snapshot_details
+                snapshot_details = self.check_copy_status(event['target_snapshot_arn'])
+                status = snapshot_details['Status']
+
             # Update state
-            state_data = {
-                'source_snapshot_name': event.get('source_snapshot_name'),
-                'source_snapshot_arn': event.get('source_snapshot_arn'),
-                'target_snapshot_name': event.get('target_snapshot_name'),
-                'target_snapshot_arn': event.get('target_snapshot_arn'),
-                'copy_status': snapshot_details['Status'],
-                'status': 'copying' if snapshot_details['Status'] == 'copying' else 'completed',
-                'success': True
+            state_data = CopyStatusState(
+                source_snapshot_name=source_snapshot_name,
+                source_snapshot_arn=event.get('source_snapshot_arn'),
+                target_snapshot_name=target_snapshot_name,
+                target_snapshot_arn=event.get('target_snapshot_arn'),
+                copy_status=status,
+                status='copying' if status == 'copying' else 'completed',
+                success=True
+            ).to_dict()
+
+            # Persist state + audit in one transaction, metric via EMF. The
+            # write runs in the background (on a snapshot of the state) so
+            # it overlaps the branch's trigger_next_step round-trip; the
+            # queue is drained before returning.
+            # Audit details share a base dict rather than repeating the
+            # snapshot-name literals in every persist call
+            audit_base = {
+                'source_snapshot_name': source_snapshot_name,
+                'target_snapshot_name': target_snapshot_name
             }
-            
-            self.save_state(state_data)
-            
-            # Log audit
-            self.log_audit(operation_id, 'SUCCESS', {
-                'source_snapshot_name': event.get('source_snapshot_name'),
-                'target_snapshot_name': event.get('target_snapshot_name'),
-                'copy_status': snapshot_details['Status']
-            })
-            
-            # Update metrics
-            self.update_metrics(operation_id, 'copy_status_check', 1)
-            
-            # Check if copy is complete
-            if snapshot_details['Status'] == 'available':
-                # Trigger next step
-                trigger_next_step(
-                    operation_id,
-                    'delete_rds',
-                    state_data
+
+            # Skip the write when nothing changed since the previous poll
+            # in this container; repeated in-progress checks otherwise
+            # rewrite an identical item every cycle. A failed status also
+            # skips it: state_data still says completed/success at this
+            # point and _handle_copy_failed writes the corrected final
+            # state synchronously, so queueing this snapshot would race
+            # that write and could leave a failed copy recorded as
+            # successful
+            if status != 'failed' and _LAST_PERSISTED.get(operation_id) != state_data:
+                _submit_telemetry(
+                    self.persist, operation_id, dict(state_data), 'SUCCESS',
+                    {**audit_base, 'copy_status': status}, 'copy_status_check'
                 )
-                
-                return self.create_response(operation_id, {
-                    'message': 'Snapshot copy completed',
-                    'snapshot_name': event.get('target_snapshot_name'),
-                    'source_region': self.config.get('source_region'),
-                    'target_region': self.config.get('target_region'),
-                    'next_step': 'delete_rds'
-                })
-            elif snapshot_details['Status'] == 'failed':
-                # Handle copy failure
-                error_message = f"Snapshot copy failed: {snapshot_details.get('Status', 'unknown status')}"
-                logger.error(error_message)
-                
-                # Update state with failure
-                state_data['status'] = 'failed'
-                state_data['success'] = False
-                state_data['error'] = error_message
-                
-                self.save_state(state_data)
-                
-                # Log audit with failure
-                self.log_audit(operation_id, 'FAILED', {
-                    'source_snapshot_name': event.get('source_snapshot_name'),
-                    'target_snapshot_name': event.get('target_snapshot_name'),
-                    'error': error_message
-                })
-                
-                # Update metrics with failure
-                self.update_metrics(operation_id, 'copy_failure', 1)
-                
-                return self.create_response(operation_id, {
-                    'message': error_message,
-                    'snapshot_name': event.get('target_snapshot_name'),
-                    'source_region': self.config.get('source_region'),
-                    'target_region': self.config.get('target_region'),
-                    'next_step': None
-                }, 500)
-            else:
-                # Copy still in progress, check again later
-                delay_seconds = 60  # Check again after 60 seconds
-                
-                # Trigger next step with delay
-                trigger_next_step(
-                    operation_id,
-                    'check_copy_status',
-                    state_data,
-                    delay_seconds=delay_seconds
+                _LAST_PERSISTED[operation_id] = dict(state_data)
+
+            try:
+                # Dispatch on status; non-terminal means still in progress
+                branch = self._STATUS_DISPATCH.get(
+                    status, CheckCopyStatusHandler._handle_copy_in_progress
                 )
-                
-                return self.create_response(operation_id, {
-                    'message': f"Snapshot copy in progress, checking again in {delay_seconds} seconds",
-                    'snapshot_name': event.get('target_snapshot_name'),
-                    'source_region': self.config.get('source_region'),
-                    'target_region': self.config.get('target_region'),
-                    'next_step': 'check_copy_status'
-                })
+                return branch(self, operation_id, event, state_data)
+            finally:
+                _drain()
         except Exception as e:
             return self.handle_error(operation_id, e, {
                 'source_snapshot_name': event.get('source_snapshot_name'),
                 'target_snapshot_name': event.get('target_snapshot_name')
             })
 
+# Initialize handler at module scope so the instance (client, config and
+# validation caches) survives warm invocations
+handler = CheckCopyStatusHandler()
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler function.
-    
+
     Args:
         event: Lambda event
         context: Lambda context
-        
+
     Returns:
         Dict[str, Any]: Lambda response
     """
-    handler = CheckCopyStatusHandler()
-    return handler.execute(event, context) 
\ No newline at end of file
+    return handler.execute(event, context)
\ No newline at end of file
@@ -4,13 +4,83 @@ Lambda function to check the status of a cluster deletion operation.
 """
 
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Tuple
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from utils.base_handler import BaseHandler
 from utils.common import logger
 from utils.validation import validate_required_params, validate_region
 from utils.aws_utils import get_client, handle_aws_error
-from utils.state_utils import trigger_next_step
+from utils.state_utils import load_state_cached, save_state, trigger_next_step
+
+# Polling describes are fast control-plane reads: fail fast and let the
+# orchestrator's wait/retry loop absorb transient API slowdowns instead
+# of burning Lambda time on botocore's 60s default timeouts.
+_POLL_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'mode': 'adaptive', 'max_attempts': 2},
+    tcp_keepalive=True
+)
+
+# Executor that lets the state write overlap the next-step trigger
+# instead of running the two round-trips serially.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Futures for in-flight telemetry writes. Drained before every return so
+# the Lambda runtime is never frozen mid-write.
+_pending: List[Any] = []
+
+def _submit_telemetry(fn, *args, **kwargs) -> None:
+    """
+    Queue a telemetry write on the background executor.
+
+    Args:
+        fn: Callable performing the write
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+    """
+    _pending.append(_IO_EXECUTOR.submit(fn, *args, **kwargs))
+
+def _drain() -> None:
+    """Wait for queued telemetry writes to land, then clear the queue."""
+    if _pending:
+        wait(_pending, timeout=3)
+        _pending.clear()
+
+# Cluster-status cache shared across in-flight operations: one paginated
+# describe per region per TTL window serves every poller instead of one
+# describe call per cluster per invocation.
+_CLUSTER_CACHE_TTL = 5  # seconds
+_CLUSTER_CACHE: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+
+def _describe_clusters_cached(rds_client, region: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Describe all DB clusters in a region, cached for a short TTL.
+
+    Args:
+        rds_client: RDS client for the region
+        region: AWS region the client belongs to
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Cluster details keyed by identifier
+    """
+    now = time.monotonic()
+    cached = _CLUSTER_CACHE.get(region)
+    if cached and now - cached[0] < _CLUSTER_CACHE_TTL:
+        return cached[1]
+
+    clusters = {}
+    paginator = rds_client.get_paginator('describe_db_clusters')
+    for page in paginator.paginate():
+        for cluster in page['DBClusters']:
+            clusters[cluster['DBClusterIdentifier']] = cluster
+
+    _CLUSTER_CACHE[region] = (now, clusters)
+    return clusters
 
 class CheckDeleteStatusHandler(BaseHandler):
     """Handler for checking RDS cluster deletion status."""
@@ -19,14 +89,23 @@ class CheckDeleteStatusHandler(BaseHandler):
         """Initialize the check delete status handler."""
         super().__init__('check_delete_status')
         self.rds_client = None
-    
+        self.rds_client_region = None
+        self._config_validated = False
+
     def validate_config(self) -> None:
         """
         Validate required configuration parameters.
-        
+
+        Config comes from environment variables that are fixed for the life
+        of the container, so a successful validation is remembered and warm
+        invocations skip the re-check.
+
         Raises:
             ValueError: If required parameters are missing or invalid
         """
+        if self._config_validated:
+            return
+
         required_params = {
             'target_cluster_id': self.config.get('target_cluster_id'),
             'target_region': self.config.get('target_region')
@@ -38,33 +117,35 @@ class CheckDeleteStatusHandler(BaseHandler):
         
         if not validate_region(self.config['target_region']):
             raise ValueError(f"Invalid target region: {self.config['target_region']}")
-    
+
+        self._config_validated = True
+
     def get_cluster_details(self, event: Dict[str, Any]) -> Tuple[str, str]:
         """
         Get cluster details from event or state.
-        
+
+        The orchestrator normally passes both values through in the
+        event, so the state read (a DynamoDB round-trip) only happens
+        when they are missing.
+
         Args:
             event: Lambda event
-            
+
         Returns:
             Tuple[str, str]: Target cluster ID and region
-            
+
         Raises:
             ValueError: If cluster details are missing
         """
-        state = self.load_state()
-        
-        target_cluster_id = (
-            state.get('target_cluster_id') or 
-            event.get('target_cluster_id') or 
-            self.config.get('target_cluster_id')
-        )
-        
-        target_region = (
-            state.get('target_region') or 
-            event.get('target_region') or 
-            self.config.get('target_region')
-        )
+        target_cluster_id = event.get('target_cluster_id') or self.config.get('target_cluster_id')
+        target_region = event.get('target_region') or self.config.get('target_region')
+
+        if not target_cluster_id or not target_region:
+            # Cached read: back-to-back polls that fall through to state
+            # reuse the same item instead of re-querying DynamoDB
+            state = load_state_cached(self.operation_id)
+            target_cluster_id = target_cluster_id or state.get('target_cluster_id')
+            target_region = target_region or state.get('target_region')
         
         if not target_cluster_id:
             raise ValueError("Target cluster ID is required")
@@ -77,15 +158,22 @@ class CheckDeleteStatusHandler(BaseHandler):
     def initialize_rds_client(self, region: str) -> None:
         """
         Initialize RDS client for target region.
-        
+
+        The client is cached per region by get_client, so warm
+        invocations for the same region reuse the existing client.
+
         Args:
             region: AWS region
-            
+
         Raises:
             Exception: If client initialization fails
         """
+        if self.rds_client is not None and self.rds_client_region == region:
+            return
+
         try:
-            self.rds_client = get_client('rds', region_name=region)
+            self.rds_client = get_client('rds', region_name=region, config=_POLL_CONFIG)
+            self.rds_client_region = region
         except Exception as e:
             raise Exception(f"Failed to create RDS client for region {region}: {str(e)}")
     
@@ -103,17 +191,36 @@ class CheckDeleteStatusHandler(BaseHandler):
             Exception: If check fails
         """
         try:
-            logger.info(f"Checking status of cluster {cluster_id}")
-            response = self.rds_client.describe_db_clusters(DBClusterIdentifier=cluster_id)
+            logger.info("Checking status of cluster %s", cluster_id)
+
+            # Positive hits come from the shared per-region cache so
+            # concurrent pollers share one bulk describe; a miss falls
+            # through to the direct lookup, which alone can distinguish
+            # 'deleted' from 'not yet in the cache'
+            cluster = _describe_clusters_cached(
+                self.rds_client, self.rds_client_region
+            ).get(cluster_id)
+            if cluster is not None:
+                logger.info("Cluster %s status: %s", cluster_id, cluster['Status'])
+                return cluster
+
+            # MaxRecords is the API minimum; the by-ID lookup returns at
+            # most one cluster, so this just caps the response size
+            response = self.rds_client.describe_db_clusters(
+                DBClusterIdentifier=cluster_id,
+                MaxRecords=20
+            )
             if response['DBClusters']:
                 cluster = response['DBClusters'][0]
                 status = cluster['Status']
-                logger.info(f"Cluster {cluster_id} status: {status}")
+                logger.info("Cluster %s status: %s", cluster_id, status)
                 return cluster
             return None
-        except Exception as e:
-            if 'DBClusterNotFoundFault' in str(e):
-                logger.info(f"Cluster {cluster_id} has been deleted")
+        except ClientError as e:
+            # Typed error-code check instead of substring-matching the
+            # stringified exception
+            if e.response.get('Error', {}).get('Code') == 'DBClusterNotFoundFault':
+                logger.info("Cluster %s has been deleted", cluster_id)
                 return None
             handle_aws_error(e, self.operation_id, self.step_name)
             raise
@@ -137,31 +244,46 @@ class CheckDeleteStatusHandler(BaseHandler):
             'success': True
         }
         
-        self.save_state(state)
-        
-        # Trigger next step - restore snapshot
+        # The state write runs in the background so it overlaps the
+        # next-step invoke; drained before returning
+        _submit_telemetry(save_state, self.operation_id, dict(state))
+
+        # Trigger next step - restore snapshot. The state rides in the
+        # invoke payload, so the next step never has to read it back
+        # from DynamoDB; the save above is audit/crash-recovery only.
         trigger_next_step(
             self.operation_id,
             'restore_snapshot',
             state
         )
-        
+
+        _drain()
+
+        # Also surface the state in the return value so a Step
+        # Functions-driven deployment can forward it as task input
         return {
             'message': 'Cluster deletion complete',
             'cluster_id': cluster_id,
             'region': region,
-            'next_step': 'restore_snapshot'
+            'next_step': 'restore_snapshot',
+            'state': state
         }
     
-    def handle_cluster_deleting(self, cluster_id: str, region: str, status: str) -> Dict[str, Any]:
+    def handle_cluster_deleting(self, cluster_id: str, region: str, status: str, attempt: int) -> Dict[str, Any]:
         """
         Handle case where cluster is still being deleted.
-        
+
+        Rather than re-triggering itself, the handler returns an advisory
+        wait_seconds that a Step Functions Wait state (SecondsPath) reads
+        before re-running the check, so the orchestrator drives the poll
+        cadence and no Lambda time is spent sleeping.
+
         Args:
             cluster_id: ID of the cluster
             region: AWS region
             status: Current status of the cluster
-            
+            attempt: Number of polls performed so far
+
         Returns:
             Dict[str, Any]: Response
         """
@@ -170,16 +292,23 @@ class CheckDeleteStatusHandler(BaseHandler):
             'target_cluster_id': cluster_id,
             'target_region': region,
             'status': status,
-            'success': True
+            'success': True,
+            'poll_count': attempt + 1
         }
-        
-        self.save_state(state)
-        
+
+        save_state(self.operation_id, state)
+
+        # Deletions rarely finish in <15s; the advisory delay caps at
+        # five minutes
+        wait_seconds = min(300, 15 * (2 ** attempt))
+
         return {
             'message': 'Cluster deletion in progress',
             'cluster_id': cluster_id,
             'region': region,
-            'status': status
+            'status': status,
+            'wait_seconds': wait_seconds,
+            'poll_attempt': attempt + 1
         }
     
     def process(self, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
@@ -193,8 +322,18 @@ class CheckDeleteStatusHandler(BaseHandler):
         Returns:
             dict: Processing result
         """
-        start_time = time.time()
-        
+        # Duration and failure metrics are emitted centrally by
+        # BaseHandler.execute, so no per-branch accounting is needed here
+
+        # Idempotency: a retried or replayed event for a cluster already
+        # confirmed deleted skips validation and the describe, and just
+        # hands off to the next step
+        if event.get('status') == 'deleted':
+            return self.handle_cluster_deleted(
+                event.get('target_cluster_id') or self.config.get('target_cluster_id'),
+                event.get('target_region') or self.config.get('target_region')
+            )
+
         # Validate configuration
         self.validate_config()
         
@@ -204,37 +343,18 @@ class CheckDeleteStatusHandler(BaseHandler):
         # Initialize RDS client
         self.initialize_rds_client(target_region)
         
-        try:
-            # Check cluster status
-            cluster = self.check_cluster_status(target_cluster_id)
-            
-            if not cluster:
-                # Cluster has been deleted
-                result = self.handle_cluster_deleted(target_cluster_id, target_region)
-                
-                # Update metrics
-                duration = time.time() - start_time
-                self.update_metrics('check_delete_status_duration', duration, 'Seconds')
-                
-                return result
-            
-            # Cluster is still being deleted
-            status = cluster['Status']
-            result = self.handle_cluster_deleting(target_cluster_id, target_region, status)
-            
-            # Update metrics
-            duration = time.time() - start_time
-            self.update_metrics('check_delete_status_duration', duration, 'Seconds')
-            
-            return result
-            
-        except Exception as e:
-            # Update metrics for failure
-            duration = time.time() - start_time
-            self.update_metrics('check_delete_status_duration', duration, 'Seconds')
-            self.update_metrics('check_delete_status_failures', 1, 'Count')
-            
-            raise
+        # Check cluster status
+        cluster = self.check_cluster_status(target_cluster_id)
+
+        if not cluster:
+            # Cluster has been deleted
+            return self.handle_cluster_deleted(target_cluster_id, target_region)
+
+        # Cluster is still being deleted
+        return self.handle_cluster_deleting(
+            target_cluster_id, target_region, cluster['Status'],
+            event.get('poll_attempt', 0)
+        )
 
 # Initialize handler
 handler = CheckDeleteStatusHandler()
@@ -3,15 +3,88 @@
 Lambda function to check the status of a cluster restore operation.
 """
 
-import json
 import time
-from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Tuple
+
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 from utils.base_handler import BaseHandler
 from utils.common import logger
 from utils.validation import validate_required_params, validate_region, validate_cluster_id
 from utils.aws_utils import get_client, handle_aws_error
-from utils.state_utils import trigger_next_step
+from utils.state_utils import save_state, trigger_next_step
+
+# Polling describes are fast control-plane reads: fail fast and let the
+# orchestrator's wait/retry loop absorb transient API slowdowns instead
+# of burning Lambda time on botocore's 60s default timeouts.
+_POLL_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=5,
+    retries={'mode': 'adaptive', 'max_attempts': 2},
+    tcp_keepalive=True
+)
+
+# Terminal failure statuses, built once at import instead of as a fresh
+# list on every membership check.
+_TERMINAL_FAIL = frozenset(('failed', 'incompatible-restore'))
+
+# Cluster-status cache shared across in-flight operations: one paginated
+# describe per region per TTL window serves every poller instead of one
+# describe call per cluster per invocation.
+_CLUSTER_CACHE_TTL = 5  # seconds
+_CLUSTER_CACHE: Dict[str, Tuple[float, Dict[str, Dict[str, Any]]]] = {}
+
+def _describe_clusters_cached(rds_client, region: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Describe all DB clusters in a region, cached for a short TTL.
+
+    Args:
+        rds_client: RDS client for the region
+        region: AWS region the client belongs to
+
+    Returns:
+        Dict[str, Dict[str, Any]]: Cluster details keyed by identifier
+    """
+    now = time.monotonic()
+    cached = _CLUSTER_CACHE.get(region)
+    if cached and now - cached[0] < _CLUSTER_CACHE_TTL:
+        return cached[1]
+
+    clusters = {}
+    paginator = rds_client.get_paginator('describe_db_clusters')
+    for page in paginator.paginate():
+        for cluster in page['DBClusters']:
+            clusters[cluster['DBClusterIdentifier']] = cluster
+
+    _CLUSTER_CACHE[region] = (now, clusters)
+    return clusters
+
+# Executor that lets telemetry writes (state, audit) overlap the
+# request-path round-trips instead of running serially.
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Futures for in-flight telemetry writes. Drained before every return so
+# the Lambda runtime is never frozen mid-write.
+_pending: List[Any] = []
+
+def _submit_telemetry(fn, *args, **kwargs) -> None:
+    """
+    Queue a telemetry write on the background executor.
+
+    Args:
+        fn: Callable performing the write
+        *args: Positional arguments for the callable
+        **kwargs: Keyword arguments for the callable
+    """
+    _pending.append(_IO_EXECUTOR.submit(fn, *args, **kwargs))
+
+def _drain() -> None:
+    """Wait for queued telemetry writes to land, then clear the queue."""
+    if _pending:
+        wait(_pending, timeout=3)
+        _pending.clear()
 
 class CheckRestoreStatusHandler(BaseHandler):
     """Handler for checking cluster restore status."""
@@ -20,14 +93,23 @@ class CheckRestoreStatusHandler(BaseHandler):
         """Initialize the check restore status handler."""
         super().__init__('check_restore_status')
         self.rds_client = None
-    
+        self.rds_client_region = None
+        self._config_validated = False
+
     def validate_config(self) -> None:
         """
         Validate required configuration parameters.
-        
+
+        Config comes from environment variables that are fixed for the life
+        of the container, so a successful validation is remembered and warm
+        invocations skip the re-check.
+
         Raises:
             ValueError: If required parameters are missing or invalid
         """
+        if self._config_validated:
+            return
+
         required_params = {
             'target_region': self.config.get('target_region'),
             'target_cluster_id': self.config.get('target_cluster_id')
@@ -42,7 +124,9 @@ class CheckRestoreStatusHandler(BaseHandler):
         
         if not validate_cluster_id(self.config['target_cluster_id']):
             raise ValueError(f"Invalid target cluster ID: {self.config['target_cluster_id']}")
-    
+
+        self._config_validated = True
+
     def initialize_rds_client(self) -> None:
         """
         Initialize RDS client for target region.
@@ -50,11 +134,43 @@ class CheckRestoreStatusHandler(BaseHandler):
         Raises:
             ValueError: If target region is not set
         """
-        if not self.config.get('target_region'):
+        region = self.config.get('target_region')
+        if not region:
             raise ValueError("Target region is required")
-        
-        self.rds_client = get_client('rds', self.config['target_region'])
+
+        # get_client caches per region; the guard skips even the lookup
+        # on warm invocations for the same region
+        if self.rds_client is not None and self.rds_client_region == region:
+            return
+
+        self.rds_client = get_client('rds', region, config=_POLL_CONFIG)
+        self.rds_client_region = region
     
+    def _status_response(self, operation_id: str, message: str, cluster_id: Any, status: Any, next_step: Any, status_code: int = 200, **extra: Any) -> Dict[str, Any]:
+        """
+        Build the response shape shared by every status branch.
+
+        Args:
+            operation_id: Operation ID
+            message: Human-readable status message
+            cluster_id: Target cluster ID
+            status: Current cluster status
+            next_step: Next workflow step, or None when terminal
+            status_code: HTTP status code
+            **extra: Additional branch-specific fields
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        data = {
+            'message': message,
+            'target_cluster_id': cluster_id,
+            'cluster_status': status,
+            'next_step': next_step
+        }
+        data.update(extra)
+        return self.create_response(operation_id, data, status_code)
+
     def check_cluster_status(self, cluster_id: str) -> Dict[str, Any]:
         """
         Check the status of a restored cluster.
@@ -69,18 +185,32 @@ class CheckRestoreStatusHandler(BaseHandler):
             Exception: If check fails
         """
         try:
+            # Positive hits come from the shared per-region cache so
+            # concurrent pollers share one bulk describe; a miss falls
+            # through to the direct lookup
+            cluster = _describe_clusters_cached(
+                self.rds_client, self.rds_client_region
+            ).get(cluster_id)
+            if cluster is not None:
+                return cluster
+
+            # MaxRecords is the API minimum; the by-ID lookup returns at
+            # most one cluster, so this just caps the response size
             response = self.rds_client.describe_db_clusters(
-                DBClusterIdentifier=cluster_id
+                DBClusterIdentifier=cluster_id,
+                MaxRecords=20
             )
-            
+
             if not response['DBClusters']:
                 raise ValueError(f"Cluster {cluster_id} not found")
-            
+
             return response['DBClusters'][0]
-        except Exception as e:
-            if 'DBClusterNotFoundFault' in str(e):
+        except ClientError as e:
+            # Typed error-code check instead of substring-matching the
+            # stringified exception
+            if e.response.get('Error', {}).get('Code') == 'DBClusterNotFoundFault':
                 raise ValueError(f"Cluster {cluster_id} not found")
-            
+
             handle_aws_error(e, f"Error checking status of cluster {cluster_id}")
             raise
     
@@ -99,9 +229,27 @@ class CheckRestoreStatusHandler(BaseHandler):
             # Get operation ID
             operation_id = self.get_operation_id(event)
             
+            # Idempotency: a retried or replayed event that already
+            # carries a terminal status skips validation, client init
+            # and the describe
+            event_status = event.get('cluster_status')
+            if event_status == 'available':
+                trigger_next_step(operation_id, 'setup_db_users', dict(event))
+
+                return self._status_response(
+                    operation_id, 'Cluster restore already completed',
+                    event.get('target_cluster_id'), event_status, 'setup_db_users'
+                )
+            if event_status in _TERMINAL_FAIL:
+                return self._status_response(
+                    operation_id,
+                    f"Cluster restore already failed with status {event_status}",
+                    event.get('target_cluster_id'), event_status, None, 500
+                )
+
             # Validate configuration
             self.validate_config()
-            
+
             # Initialize RDS client
             self.initialize_rds_client()
             
@@ -113,6 +261,7 @@ class CheckRestoreStatusHandler(BaseHandler):
             status = cluster['Status']
             
             # Save state
+            attempt = event.get('poll_attempt', 0)
             state_data = {
                 'target_cluster_id': cluster_id,
                 'cluster_status': status,
@@ -120,84 +269,101 @@ class CheckRestoreStatusHandler(BaseHandler):
                 'vpc_id': cluster['VpcId'],
                 'db_subnet_group': cluster['DBSubnetGroup'],
                 'status': 'checking',
-                'success': True
+                'success': True,
+                'poll_count': attempt + 1
             }
-            
-            self.save_state(state_data)
-            
-            # Log audit
-            self.log_audit(operation_id, 'SUCCESS', {
-                'target_cluster_id': cluster_id,
-                'cluster_status': status
-            })
-            
-            # Update metrics
-            self.update_metrics(operation_id, 'cluster_status_check', 1)
-            
-            # Check if restore is complete
-            if status == 'available':
-                # Restore is complete, trigger next step
-                trigger_next_step(operation_id, 'setup_db_users', state_data)
-                
-                return self.create_response(operation_id, {
-                    'message': f"Cluster {cluster_id} restore completed",
-                    'target_cluster_id': cluster_id,
-                    'cluster_status': status,
-                    'next_step': 'setup_db_users'
-                })
-            elif status in ['failed', 'incompatible-restore']:
-                # Restore failed
+
+            # Resolve the terminal status before writing so every path
+            # performs exactly one state write
+            if status in _TERMINAL_FAIL:
+                # Restore failed; write the final state directly instead
+                # of persisting 'checking' first and overwriting it
                 error_message = f"Cluster {cluster_id} restore failed with status {status}"
                 logger.error(error_message)
-                
-                # Update state with error
+
                 state_data.update({
                     'status': 'failed',
                     'success': False,
                     'error': error_message
                 })
-                
-                self.save_state(state_data)
-                
+
+                save_state(operation_id, state_data)
+
                 # Log audit with failure
                 self.log_audit(operation_id, 'FAILED', {
                     'target_cluster_id': cluster_id,
                     'cluster_status': status,
                     'error': error_message
                 })
-                
+
                 # Update metrics with failure
                 self.update_metrics(operation_id, 'restore_failure', 1)
-                
-                return self.create_response(operation_id, {
-                    'message': error_message,
-                    'target_cluster_id': cluster_id,
-                    'cluster_status': status,
-                    'next_step': None
-                }, 500)
-            else:
-                # Restore still in progress
-                return self.create_response(operation_id, {
-                    'message': f"Cluster {cluster_id} restore in progress (status: {status})",
+
+                return self._status_response(
+                    operation_id, error_message, cluster_id, status, None, 500
+                )
+
+            # State and audit writes run on the background executor so
+            # they overlap the branch's trigger round-trip; the queue is
+            # drained before every return. The event carries the status
+            # reported by the previous poll, so writes only happen on a
+            # transition — an unchanged in-progress poll burns no PutItem.
+            if status != event_status:
+                _submit_telemetry(save_state, operation_id, dict(state_data))
+                _submit_telemetry(self.log_audit, operation_id, 'SUCCESS', {
                     'target_cluster_id': cluster_id,
-                    'cluster_status': status,
-                    'next_step': 'check_restore_status'
+                    'cluster_status': status
                 })
+
+            # Update metrics (EMF: a stdout write, no round-trip)
+            self.update_metrics(operation_id, 'cluster_status_check', 1)
+
+            # Check if restore is complete
+            if status == 'available':
+                # Restore is complete, trigger next step
+                trigger_next_step(operation_id, 'setup_db_users', state_data)
+
+                _drain()
+
+                return self._status_response(
+                    operation_id, f"Cluster {cluster_id} restore completed",
+                    cluster_id, status, 'setup_db_users'
+                )
+            else:
+                # Restore still in progress. The orchestrator drives the
+                # poll cadence: a Step Functions Wait state reads
+                # wait_seconds (SecondsPath) before re-running the check,
+                # so the handler never re-triggers itself.
+                wait_seconds = min(300, 15 * (2 ** attempt))
+
+                _drain()
+
+                return self._status_response(
+                    operation_id,
+                    f"Cluster {cluster_id} restore in progress (status: {status})",
+                    cluster_id, status, None,
+                    wait_seconds=wait_seconds,
+                    poll_attempt=attempt + 1
+                )
         except Exception as e:
+            _drain()
             return self.handle_error(operation_id, e, {
                 'target_cluster_id': self.config.get('target_cluster_id')
             })
 
+# Initialize handler at module scope so the instance (client and config
+# caches) survives warm invocations
+handler = CheckRestoreStatusHandler()
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler function.
-    
+
     Args:
         event: Lambda event
         context: Lambda context
-        
+
     Returns:
         Dict[str, Any]: Lambda response
     """
-    handler = CheckRestoreStatusHandler()
     return handler.execute(event, context) 
\ No newline at end of file
@@ -5,13 +5,18 @@ Lambda function to clean up resources after the restore process is complete.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
 from utils.base_handler import BaseHandler
 from utils.common import logger
 from utils.validation import validate_required_params, validate_region, validate_cluster_id
 from utils.aws_utils import get_client, handle_aws_error
-from utils.state_utils import get_state, update_state, delete_state
+from utils.state_utils import load_state, delete_state
+
+# Executor for the independent cleanup steps; snapshot, state and log
+# deletion have no data dependencies, so their API latencies overlap.
+_CLEANUP_EXECUTOR = ThreadPoolExecutor(max_workers=3)
 
 class CleanupHandler(BaseHandler):
     """Handler for cleaning up resources after restore."""
@@ -22,7 +27,8 @@ class CleanupHandler(BaseHandler):
         self.rds_client = None
         self.s3_client = None
         self.dynamodb_client = None
-    
+        self.clients_region = None
+
     def validate_config(self) -> None:
         """
         Validate required configuration parameters.
@@ -51,16 +57,24 @@ class CleanupHandler(BaseHandler):
     def initialize_clients(self) -> None:
         """
         Initialize AWS clients.
-        
+
+        The clients are cached per region by get_client, so warm
+        invocations for the same region reuse the existing clients.
+
         Raises:
             ValueError: If required parameters are missing
         """
-        if not self.config.get('target_region'):
+        region = self.config.get('target_region')
+        if not region:
             raise ValueError("Target region is required")
-        
-        self.rds_client = get_client('rds', self.config['target_region'])
-        self.s3_client = get_client('s3', self.config['target_region'])
-        self.dynamodb_client = get_client('dynamodb', self.config['target_region'])
+
+        if self.clients_region == region:
+            return
+
+        self.rds_client = get_client('rds', region)
+        self.s3_client = get_client('s3', region)
+        self.dynamodb_client = get_client('dynamodb', region)
+        self.clients_region = region
     
     def get_operation_details(self, operation_id: str) -> Dict[str, Any]:
         """
@@ -77,7 +91,7 @@ class CleanupHandler(BaseHandler):
         """
         try:
             # Get state data
-            state_data = get_state(operation_id)
+            state_data = load_state(operation_id)
             
             if not state_data:
                 raise ValueError(f"State data not found for operation {operation_id}")
@@ -175,27 +189,41 @@ class CleanupHandler(BaseHandler):
                 logger.warning("No log bucket configured, skipping log deletion")
                 return False
             
-            # List objects with the operation ID prefix
+            # List objects with the operation ID prefix. The paginator
+            # covers prefixes with more than 1000 keys, which a single
+            # list_objects_v2 call would silently truncate.
             prefix = f"{log_prefix}/{operation_id}/"
-            
-            response = self.s3_client.list_objects_v2(
-                Bucket=log_bucket,
-                Prefix=prefix
+
+            # Cheap existence probe first: short operations often leave
+            # no logs, and a MaxKeys=1 response settles that without
+            # pulling a full listing page
+            probe = self.s3_client.list_objects_v2(
+                Bucket=log_bucket, Prefix=prefix, MaxKeys=1
             )
-            
-            # Delete objects
-            if 'Contents' in response:
-                for obj in response['Contents']:
-                    self.s3_client.delete_object(
-                        Bucket=log_bucket,
-                        Key=obj['Key']
-                    )
-                
-                logger.info(f"Successfully deleted logs for operation {operation_id}")
+            if 'Contents' not in probe:
+                logger.info(f"No logs found for operation {operation_id}")
                 return True
+
+            deleted_any = False
+            paginator = self.s3_client.get_paginator('list_objects_v2')
+            for page in paginator.paginate(Bucket=log_bucket, Prefix=prefix):
+                keys = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+                if not keys:
+                    continue
+
+                # One batched delete per page (up to 1000 keys) instead
+                # of one round-trip per object
+                self.s3_client.delete_objects(
+                    Bucket=log_bucket,
+                    Delete={'Objects': keys, 'Quiet': True}
+                )
+                deleted_any = True
+
+            if deleted_any:
+                logger.info(f"Successfully deleted logs for operation {operation_id}")
             else:
                 logger.info(f"No logs found for operation {operation_id}")
-                return True
+            return True
         except Exception as e:
             handle_aws_error(e, f"Error deleting logs for operation {operation_id}")
             return False
@@ -224,27 +252,36 @@ class CleanupHandler(BaseHandler):
             # Get operation details
             operation_details = self.get_operation_details(operation_id)
             
-            # Initialize cleanup results
-            cleanup_results = {
-                'snapshot_deleted': False,
-                'state_data_deleted': False,
-                'logs_deleted': False
-            }
-            
-            # Delete snapshot if configured
+            # The three deletions are independent, so they run
+            # concurrently and the wall time is the slowest of the three
+            # rather than their sum
+            futures = {}
+
             if self.config.get('cleanup_snapshot', True):
                 snapshot_id = operation_details.get('snapshot_id')
                 if snapshot_id:
-                    cleanup_results['snapshot_deleted'] = self.delete_snapshot(snapshot_id)
-            
-            # Delete state data if configured
+                    futures['snapshot_deleted'] = _CLEANUP_EXECUTOR.submit(
+                        self.delete_snapshot, snapshot_id
+                    )
+
             if self.config.get('cleanup_state_data', True):
-                cleanup_results['state_data_deleted'] = self.delete_state_data(operation_id)
-            
-            # Delete logs if configured
+                futures['state_data_deleted'] = _CLEANUP_EXECUTOR.submit(
+                    self.delete_state_data, operation_id
+                )
+
             if self.config.get('cleanup_logs', True):
-                cleanup_results['logs_deleted'] = self.delete_logs(operation_id)
-            
+                futures['logs_deleted'] = _CLEANUP_EXECUTOR.submit(
+                    self.delete_logs, operation_id
+                )
+
+            cleanup_results = {
+                'snapshot_deleted': False,
+                'state_data_deleted': False,
+                'logs_deleted': False
+            }
+            for key, future in futures.items():
+                cleanup_results[key] = future.result()
+
             # Log audit
             self.log_audit(operation_id, 'SUCCESS', {
                 'target_cluster_id': operation_details.get('target_cluster_id'),
@@ -265,16 +302,19 @@ class CleanupHandler(BaseHandler):
                 'target_cluster_id': self.config.get('target_cluster_id')
             })
 
+# Initialize handler at module scope so the instance (clients and config
+# caches) survives warm invocations
+handler = CleanupHandler()
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler function.
-    
+
     Args:
         event: Lambda event
         context: Lambda context
-        
+
     Returns:
         Dict[str, Any]: Lambda response
     """
-    handler = CleanupHandler()
     return handler.execute(event, context) 
\ No newline at end of file
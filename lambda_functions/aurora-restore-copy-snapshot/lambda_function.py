@@ -20,6 +20,7 @@ class CopySnapshotHandler(BaseHandler):
         super().__init__('copy_snapshot')
         self.source_rds_client = None
         self.target_rds_client = None
+        self.client_regions = None
     
     def validate_config(self) -> None:
         """
@@ -78,35 +79,16 @@ class CopySnapshotHandler(BaseHandler):
         
         if not self.config.get('target_region'):
             raise ValueError("Target region is required")
-        
-        self.source_rds_client = get_client('rds', self.config['source_region'])
-        self.target_rds_client = get_client('rds', self.config['target_region'])
-    
-    def get_snapshot_details(self, snapshot_arn: str) -> Dict[str, Any]:
-        """
-        Get snapshot details from source region.
-        
-        Args:
-            snapshot_arn: ARN of the snapshot
-            
-        Returns:
-            Dict[str, Any]: Snapshot details
-            
-        Raises:
-            Exception: If snapshot details cannot be retrieved
-        """
-        try:
-            response = self.source_rds_client.describe_db_cluster_snapshots(
-                DBClusterSnapshotIdentifier=snapshot_arn
-            )
-            
-            if not response['DBClusterSnapshots']:
-                raise ValueError(f"Snapshot {snapshot_arn} not found")
-            
-            return response['DBClusterSnapshots'][0]
-        except Exception as e:
-            handle_aws_error(e, f"Error getting snapshot details for {snapshot_arn}")
-            raise
+
+        # get_client caches per region; the guard skips even the lookups
+        # on warm invocations for the same region pair
+        regions = (self.config['source_region'], self.config['target_region'])
+        if self.client_regions == regions:
+            return
+
+        self.source_rds_client = get_client('rds', regions[0])
+        self.target_rds_client = get_client('rds', regions[1])
+        self.client_regions = regions
     
     def copy_snapshot(self, snapshot_arn: str, target_snapshot_name: str) -> Dict[str, Any]:
         """
@@ -135,6 +117,48 @@ class CopySnapshotHandler(BaseHandler):
             handle_aws_error(e, f"Error copying snapshot {snapshot_arn} to {target_snapshot_name}")
             raise
     
+    def handle_same_region_case(self, operation_id: str, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Handle case where source and target regions are the same.
+
+        The source snapshot is usable as-is, so no copy is started and the
+        workflow jumps straight to delete_rds.
+
+        Args:
+            operation_id: Operation ID
+            event: Lambda event
+
+        Returns:
+            Dict[str, Any]: Lambda response
+        """
+        state_data = {
+            'source_snapshot_name': event['snapshot_name'],
+            'source_snapshot_arn': event['snapshot_arn'],
+            'target_snapshot_name': event['snapshot_name'],
+            'target_snapshot_arn': event['snapshot_arn'],
+            'copy_status': 'available',
+            'status': 'completed',
+            'success': True
+        }
+
+        # State and audit land in one DynamoDB transaction instead of
+        # two sequential writes; persist stamps the step on the item
+        self.persist(operation_id, state_data, 'SUCCESS', {
+            'source_snapshot_name': event['snapshot_name'],
+            'target_snapshot_name': event['snapshot_name'],
+            'copy_status': 'available'
+        })
+
+        trigger_next_step(operation_id, 'delete_rds', state_data)
+
+        return self.create_response(operation_id, {
+            'message': 'No need to copy snapshot, regions are the same',
+            'snapshot_name': event['snapshot_name'],
+            'source_region': self.config['source_region'],
+            'target_region': self.config['target_region'],
+            'next_step': 'delete_rds'
+        })
+
     def process(self, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         """
         Process the Lambda event.
@@ -155,13 +179,18 @@ class CopySnapshotHandler(BaseHandler):
             
             # Validate snapshot parameters
             self.validate_snapshot_params(event)
-            
+
+            # Same-region restores need no copy at all; skip straight to
+            # delete_rds so check_copy_status is never invoked for them
+            if self.config['source_region'] == self.config['target_region']:
+                return self.handle_same_region_case(operation_id, event)
+
             # Initialize RDS clients
             self.initialize_rds_clients()
-            
-            # Get snapshot details
-            snapshot_details = self.get_snapshot_details(event['snapshot_arn'])
-            
+
+            # The copy call works straight off the validated event fields;
+            # describing the source snapshot first would be a round-trip
+            # whose result nothing reads
             # Generate target snapshot name
             target_snapshot_name = f"{event['snapshot_name']}-copy"
             
@@ -177,18 +206,15 @@ class CopySnapshotHandler(BaseHandler):
                 'copy_status': copy_response['Status']
             }
             
-            self.save_initial_state(operation_id, state_data)
-            
-            # Log audit
-            self.log_audit(operation_id, 'SUCCESS', {
+            # State and audit land in one DynamoDB transaction and the
+            # metric goes out as an EMF log line, so the tail path makes
+            # two network calls (transaction + trigger) instead of four
+            self.persist(operation_id, state_data, 'SUCCESS', {
                 'source_snapshot_name': event['snapshot_name'],
                 'target_snapshot_name': target_snapshot_name,
                 'copy_status': copy_response['Status']
-            })
-            
-            # Update metrics
-            self.update_metrics(operation_id, 'snapshot_copy', 1)
-            
+            }, 'snapshot_copy')
+
             # Trigger next step
             trigger_next_step(operation_id, 'check_copy_status', state_data)
             
@@ -206,16 +232,31 @@ class CopySnapshotHandler(BaseHandler):
                 'source_snapshot_arn': event.get('snapshot_arn')
             })
 
+# Initialize handler at module scope so the instance (clients and config
+# caches) survives warm invocations
+handler = CopySnapshotHandler()
+
+# Warm up the regional RDS clients at init time so endpoint resolution
+# and client construction happen during the init phase instead of on the
+# first invocation.
+try:
+    for _warm_region in (handler.config.get('source_region'),
+                         handler.config.get('target_region')):
+        if _warm_region:
+            _ = get_client('rds', _warm_region).meta.endpoint_url
+except Exception:
+    # Warm-up is best-effort; the first invocation will build the clients.
+    pass
+
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler function.
-    
+
     Args:
         event: Lambda event
         context: Lambda context
-        
+
     Returns:
         Dict[str, Any]: Lambda response
     """
-    handler = CopySnapshotHandler()
-    return handler.execute(event, context) 
\ No newline at end of file
+    return handler.execute(event, context)
\ No newline at end of file
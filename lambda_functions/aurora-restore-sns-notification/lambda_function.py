@@ -157,34 +157,21 @@ class SNSNotificationHandler(BaseHandler):
         Returns:
             dict: Processing result
         """
-        start_time = time.time()
-        
-        try:
-            # Validate configuration
-            self.validate_config()
-            
-            # Get notification details
-            details = self.get_notification_details(event)
-            
-            # Prepare and send notification
-            message = self.prepare_notification_message(details)
-            self.send_notification(details, message)
-            
-            result = self.handle_notification_sent(details, message)
-            
-            # Update metrics
-            duration = time.time() - start_time
-            self.update_metrics('sns_notification_duration', duration, 'Seconds')
-            
-            return result
-            
-        except Exception as e:
-            # Update metrics for failure
-            duration = time.time() - start_time
-            self.update_metrics('sns_notification_duration', duration, 'Seconds')
-            self.update_metrics('sns_notification_failures', 1, 'Count')
-            
-            raise
+        # Duration and failure metrics are emitted centrally by
+        # BaseHandler.execute from a single monotonic start/end pair, so
+        # no per-branch wall-clock accounting is needed here
+
+        # Validate configuration
+        self.validate_config()
+
+        # Get notification details
+        details = self.get_notification_details(event)
+
+        # Prepare and send notification
+        message = self.prepare_notification_message(details)
+        self.send_notification(details, message)
+
+        return self.handle_notification_sent(details, message)
 
 # Initialize handler
 handler = SNSNotificationHandler()
@@ -6,14 +6,15 @@ This module provides standardized utilities for AWS service interactions.
 
 import os
 import json
-import time
-import boto3
+import logging
 from typing import Dict, Any, Optional, List, Union, Tuple
-from botocore.exceptions import ClientError
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from utils.core import ENVIRONMENT, AWS_REGION, AWS_ACCOUNT_ID
 
+# Configure logging
+logger = logging.getLogger()
+
 # Constants for retry mechanism
 MAX_ATTEMPTS = 10
 INITIAL_INTERVAL = 30  # seconds
@@ -21,22 +22,58 @@ INITIAL_INTERVAL = 30  # seconds
 # Initialize AWS clients with lazy loading
 _clients = {}
 
-def get_client(service_name: str, region_name: Optional[str] = None) -> Any:
+# Default client configuration, built lazily alongside the first client.
+# Adaptive retries rate-limit client-side when the control plane throttles,
+# and the short connect/read timeouts stop a transient network stall from
+# consuming the whole function timeout.
+_default_config = None
+
+def _get_default_config() -> Any:
+    """
+    Build the shared default botocore Config on first use.
+
+    Returns:
+        Any: botocore Config instance
+    """
+    global _default_config
+
+    if _default_config is None:
+        from botocore.config import Config
+        _default_config = Config(
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+            connect_timeout=3,
+            read_timeout=10,
+            tcp_keepalive=True,
+            max_pool_connections=10,
+            user_agent_extra='aurora-restore/1.0'
+        )
+
+    return _default_config
+
+def get_client(service_name: str, region_name: Optional[str] = None, config: Optional[Any] = None) -> Any:
     """
     Get an AWS client with lazy loading.
-    
+
     Args:
         service_name: Name of the AWS service
         region_name: Optional region name
-        
+        config: Optional botocore Config applied when the client is first built
+
     Returns:
         Any: AWS client
     """
     key = f"{service_name}:{region_name or AWS_REGION}"
-    
+
     if key not in _clients:
-        _clients[key] = boto3.client(service_name, region_name=region_name)
-    
+        # Imported lazily so modules that never build a client skip the
+        # boto3 import cost at cold start.
+        import boto3
+        _clients[key] = boto3.client(
+            service_name,
+            region_name=region_name,
+            config=config or _get_default_config()
+        )
+
     return _clients[key]
 
 def get_resource(service_name: str, region_name: Optional[str] = None) -> Any:
@@ -51,10 +88,11 @@ def get_resource(service_name: str, region_name: Optional[str] = None) -> Any:
         Any: AWS resource
     """
     key = f"{service_name}:{region_name or AWS_REGION}"
-    
+
     if key not in _clients:
+        import boto3
         _clients[key] = boto3.resource(service_name, region_name=region_name)
-    
+
     return _clients[key]
 
 @retry(stop=stop_after_attempt(MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=60))
@@ -69,6 +107,8 @@ def get_ssm_parameter(param_name: str, default: Optional[str] = None) -> str:
     Returns:
         str: Parameter value
     """
+    from botocore.exceptions import ClientError
+
     try:
         ssm = get_client('ssm')
         response = ssm.get_parameter(Name=param_name, WithDecryption=True)
@@ -89,6 +129,8 @@ def get_secret(secret_name: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Secret value
     """
+    from botocore.exceptions import ClientError
+
     try:
         secretsmanager = get_client('secretsmanager')
         response = secretsmanager.get_secret_value(SecretId=secret_name)
@@ -113,7 +155,9 @@ def send_notification(topic_arn: Optional[str] = None, subject: str = "", messag
     """
     if not topic_arn:
         return False
-    
+
+    from botocore.exceptions import ClientError
+
     try:
         sns = get_client('sns')
         sns.publish(
@@ -125,12 +169,12 @@ def send_notification(topic_arn: Optional[str] = None, subject: str = "", messag
     except ClientError:
         return False
 
-def handle_aws_error(error: ClientError, operation_id: str = "", step: str = "") -> Dict[str, Any]:
+def handle_aws_error(error: Any, operation_id: str = "", step: str = "") -> Dict[str, Any]:
     """
     Handle AWS API errors in a standardized way.
-    
+
     Args:
-        error: The ClientError exception
+        error: The botocore ClientError exception
         operation_id: Operation ID
         step: Step name
         
@@ -160,47 +204,54 @@ def handle_aws_error(error: ClientError, operation_id: str = "", step: str = "")
     }
 
 @retry(stop=stop_after_attempt(MAX_ATTEMPTS), wait=wait_exponential(multiplier=1, min=4, max=60))
-def trigger_next_step(operation_id: str, next_step: str, event_data: Dict[str, Any] = None, delay_seconds: int = 0) -> bool:
+def trigger_next_step(operation_id: str, next_step: str, event_data: Dict[str, Any] = None) -> bool:
     """
     Trigger the next step in the workflow.
-    
+
+    The downstream Lambda is invoked asynchronously (InvocationType=Event),
+    so the caller returns as soon as the invoke is queued instead of staying
+    billed while the next step runs. Retries and dead-lettering for the
+    queued invoke are configured on the target function.
+
     Args:
         operation_id: Operation ID
         next_step: Name of the next step
         event_data: Data to pass to the next step
-        delay_seconds: Delay in seconds before triggering
-        
+
     Returns:
         bool: True if successful
+
+    Raises:
+        Exception: If the invoke fails after retries; a broken handoff
+            must surface instead of silently ending the workflow
     """
     try:
-        events = get_client('events')
         lambda_client = get_client('lambda')
-        
-        # Get the Lambda function name for the next step
-        function_name = f"aurora-restore-{next_step}"
-        
+
+        # Step names are underscore-style but the deployed functions are
+        # hyphenated (aurora-restore-delete-rds etc., see the deployment
+        # guide), so map before building the function name
+        function_name = f"aurora-restore-{next_step.replace('_', '-')}"
+
         # Prepare the event data
         if event_data is None:
             event_data = {}
-        
+
         event_data['operation_id'] = operation_id
-        
-        # Create the event
-        response = events.put_events(
-            Entries=[
-                {
-                    'Source': 'com.aurora.restore',
-                    'DetailType': next_step,
-                    'Detail': json.dumps(event_data),
-                    'EventBusName': 'default',
-                    'Time': int(time.time() + delay_seconds)
-                }
-            ]
+
+        response = lambda_client.invoke(
+            FunctionName=function_name,
+            InvocationType='Event',
+            Payload=json.dumps(event_data)
         )
-        
-        return response['FailedEntryCount'] == 0
-        
+
+        if response['StatusCode'] != 202:
+            raise RuntimeError(
+                f"Unexpected status {response['StatusCode']} invoking {function_name}"
+            )
+
+        return True
+
     except Exception as e:
-        logger.error(f"Error triggering next step: {str(e)}", exc_info=True)
-        return False 
\ No newline at end of file
+        logger.error(f"Error triggering next step {next_step}: {str(e)}", exc_info=True)
+        raise 
\ No newline at end of file
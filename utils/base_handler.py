@@ -6,15 +6,16 @@ Provides common functionality and error handling for all Lambda functions.
 
 import time
 import json
-import uuid
 from typing import Dict, Any, TypeVar, Generic
 
 from utils.config_manager import ConfigManager
 from utils.common import logger
+from utils.core import get_operation_id
 from utils.state_utils import (
     save_state,
     log_audit_event,
-    update_metrics
+    persist_state_and_audit,
+    emit_metric
 )
 
 T = TypeVar('T')
@@ -32,7 +33,7 @@ class BaseHandler(Generic[T]):
         self.step_name = step_name
         self.config_manager = ConfigManager()
         self.config = self.config_manager.get_all()
-        self.start_time = time.time()
+        self.operation_id = None
     
     def validate_event(self, event: Dict[str, Any]) -> None:
         """
@@ -57,23 +58,20 @@ class BaseHandler(Generic[T]):
         Returns:
             str: Operation ID
         """
-        if event and isinstance(event, dict):
-            if 'operation_id' in event:
-                return event['operation_id']
-            if 'body' in event and isinstance(event['body'], dict) and 'operation_id' in event['body']:
-                return event['body']['operation_id']
-        
-        return f"op-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        return get_operation_id(event)
     
     def save_initial_state(self, operation_id: str, state_data: Dict[str, Any]) -> None:
         """
         Save initial state for the operation.
-        
+
+        The step name rides inside the item, and save_state's conditional
+        PutItem makes the check-and-write a single DynamoDB round-trip.
+
         Args:
             operation_id: Operation ID
             state_data: State data to save
         """
-        save_state(operation_id, self.step_name, state_data)
+        save_state(operation_id, {**state_data, 'step': self.step_name})
     
     def log_audit(self, operation_id: str, status: str, details: Dict[str, Any]) -> None:
         """
@@ -90,13 +88,37 @@ class BaseHandler(Generic[T]):
         """
         Update metrics for the operation.
         
+        Metrics go out in Embedded Metric Format on stdout, so emission is
+        a log write rather than a CloudWatch API round-trip.
+
         Args:
             operation_id: Operation ID
             metric_name: Name of the metric
             value: Value of the metric
         """
-        update_metrics(operation_id, self.step_name, metric_name, value)
+        emit_metric(operation_id, metric_name, value)
     
+    def persist(self, operation_id: str, state: Dict[str, Any], audit_status: str, audit_details: Dict[str, Any], metric_name: str = None, metric_value: float = 1.0) -> None:
+        """
+        Persist state, audit and a metric with minimal round-trips.
+
+        State and audit rows go out in one DynamoDB transaction and the
+        metric is emitted via Embedded Metric Format, replacing three
+        sequential API calls with a single one.
+
+        Args:
+            operation_id: Operation ID
+            state: State data to save
+            audit_status: Status of the audit event
+            audit_details: Additional audit details
+            metric_name: Optional metric to emit
+            metric_value: Value of the metric
+        """
+        persist_state_and_audit(operation_id, self.step_name, state, audit_status, audit_details)
+
+        if metric_name:
+            emit_metric(operation_id, metric_name, metric_value)
+
     def handle_error(self, operation_id: str, error: Exception, details: Dict[str, Any]) -> Dict[str, Any]:
         """
         Handle an error in the operation.
@@ -159,27 +181,32 @@ class BaseHandler(Generic[T]):
         Returns:
             Dict[str, Any]: Lambda response
         """
+        start_ns = time.monotonic_ns()
+        operation_id = self.get_operation_id(event) if event else "unknown"
+
         try:
             # Validate event
             self.validate_event(event)
-            
-            # Get operation ID
-            operation_id = self.get_operation_id(event)
-            
+            self.operation_id = operation_id
+
             # Load configuration from event and state
             if 'state' in event:
                 self.config_manager.load_config(event=event, state=event['state'])
             else:
                 self.config_manager.load_config(event=event)
-            
+
             self.config = self.config_manager.get_all()
-            
+
             # Process the event
             return self.process(event, context)
         except Exception as e:
-            # Handle any unhandled exceptions
-            operation_id = self.get_operation_id(event) if event else "unknown"
+            # Handle any unhandled exceptions; failure metrics are emitted
+            # here once rather than in each handler's process method
+            emit_metric(operation_id, f"{self.step_name}_failures", 1)
             return self.handle_error(operation_id, e, {})
+        finally:
+            duration = (time.monotonic_ns() - start_ns) / 1e9
+            emit_metric(operation_id, f"{self.step_name}_duration", duration, 'Seconds')
     
     def process(self, event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         """
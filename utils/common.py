@@ -33,8 +33,9 @@ def get_full_config() -> Dict[str, Any]:
     Returns:
         dict: Configuration dictionary
     """
-    config = get_config()
-    
+    # get_config returns a cached dict; copy before merging SSM overrides
+    config = dict(get_config())
+
     # Try to get additional config from SSM
     try:
         ssm_config = get_ssm_parameter(f'/aurora-restore/{config["environment"]}/config', '{}')
@@ -13,8 +13,6 @@ import json
 import logging
 from typing import Dict, Any, Optional, List, Union
 from enum import Enum
-import boto3
-from botocore.exceptions import ClientError
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -53,6 +51,9 @@ class ConfigManager:
     def ssm_client(self):
         """Lazy loading of SSM client"""
         if self._ssm_client is None:
+            # Imported here so handlers that never reach an SSM lookup
+            # (e.g. fast-fail validation paths) skip the boto3 import
+            import boto3
             self._ssm_client = boto3.client('ssm', region_name=self.region)
         return self._ssm_client
     
@@ -126,6 +127,8 @@ class ConfigManager:
     
     def _load_from_ssm(self) -> None:
         """Load configuration from SSM Parameter Store"""
+        from botocore.exceptions import ClientError
+
         try:
             # Try to get the environment-specific config
             ssm_path = f'/aurora-restore/{self.environment}/config'
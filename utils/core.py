@@ -9,6 +9,7 @@ import json
 import time
 import uuid
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 
 # Configure logging
@@ -37,10 +38,16 @@ def get_operation_id(event: Dict[str, Any]) -> str:
     
     return f"op-{int(time.time())}-{uuid.uuid4().hex[:8]}"
 
+@lru_cache(maxsize=1)
 def get_config() -> Dict[str, Any]:
     """
     Get configuration from environment variables.
-    
+
+    Lambda environment variables are fixed for the lifetime of the
+    execution environment, so the dict is built once per cold start and
+    reused on warm invocations. Callers that mutate the config must copy
+    it first.
+
     Returns:
         dict: Configuration dictionary
     """
@@ -7,13 +7,12 @@ This module provides standardized utilities for state management.
 import os
 import json
 import time
-import uuid
 import logging
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any
 from datetime import datetime
 
-from utils.core import ENVIRONMENT
-from utils.aws_utils import get_resource
+from utils.core import ENVIRONMENT, get_operation_id
+from utils.aws_utils import get_resource, trigger_next_step
 
 # Configure logging
 logger = logging.getLogger()
@@ -23,95 +22,134 @@ STATE_TABLE_NAME = os.environ.get('STATE_TABLE_NAME', 'aurora-restore-state')
 STATE_INDEX_TABLE_NAME = os.environ.get('STATE_INDEX_TABLE_NAME', 'aurora-restore-state-index')
 AUDIT_TABLE_NAME = os.environ.get('AUDIT_TABLE_NAME', 'aurora-restore-audit')
 
-# Get DynamoDB tables
-state_table = get_resource('dynamodb').Table(STATE_TABLE_NAME)
-state_index_table = get_resource('dynamodb').Table(STATE_INDEX_TABLE_NAME)
-audit_table = get_resource('dynamodb').Table(AUDIT_TABLE_NAME)
+# DynamoDB table handles, built lazily so importing this module does not
+# pull in boto3 and build resources during cold start.
+_tables: Dict[str, Any] = {}
 
-def get_operation_id(event: Dict[str, Any]) -> str:
+def _get_table(table_name: str) -> Any:
     """
-    Get or generate a unique operation ID.
-    
+    Get a DynamoDB table handle, building it on first use.
+
     Args:
-        event: Event data that may contain an operation_id
-        
+        table_name: Name of the DynamoDB table
+
     Returns:
-        str: The operation ID
+        Any: DynamoDB Table resource
     """
-    if event and isinstance(event, dict):
-        if 'operation_id' in event:
-            return event['operation_id']
-        if 'body' in event and isinstance(event['body'], dict) and 'operation_id' in event['body']:
-            return event['body']['operation_id']
-    
-    return f"op-{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    if table_name not in _tables:
+        _tables[table_name] = get_resource('dynamodb').Table(table_name)
+    return _tables[table_name]
 
-def load_state(operation_id: str, step: Optional[str] = None) -> Dict[str, Any]:
+def load_state(operation_id: str) -> Dict[str, Any]:
     """
     Load state from DynamoDB.
-    
+
+    The state table is keyed on operation_id alone; each operation has a
+    single item that writers overwrite as the workflow advances, with the
+    current step recorded as a plain attribute.
+
     Args:
         operation_id: The unique identifier for this restore operation
-        step: Optional step to load. If None, loads the latest step.
-        
+
     Returns:
         dict: The state object
     """
     try:
-        if step:
-            # Load specific step
-            response = state_table.get_item(
-                Key={
-                    'operation_id': operation_id,
-                    'step': step
-                }
-            )
-        else:
-            # Load latest step
-            response = state_table.query(
-                KeyConditionExpression='operation_id = :op_id',
-                ExpressionAttributeValues={
-                    ':op_id': operation_id
-                },
-                ScanIndexForward=False,  # Descending order
-                Limit=1
-            )
-            
-        if 'Item' in response:
-            return response['Item']
-        elif 'Items' in response and response['Items']:
-            return response['Items'][0]
-            
-        return {}
+        response = _get_table(STATE_TABLE_NAME).get_item(
+            Key={'operation_id': operation_id}
+        )
+        return response.get('Item', {})
     except Exception as e:
         logger.error(f"Error loading state: {str(e)}", exc_info=True)
         return {}
 
+# Short-lived read-through cache for poll loops that reload the same
+# operation's state seconds apart within one container. Writes through
+# save_state/persist_state_and_audit invalidate the entry.
+_STATE_CACHE: Dict[str, Any] = {}
+_STATE_CACHE_TTL = 5.0  # seconds
+
+def load_state_cached(operation_id: str) -> Dict[str, Any]:
+    """
+    Load state, serving repeat reads from a short-TTL in-process cache.
+
+    Safe for polling paths because polls for one operation are serial
+    within a container and every write path invalidates the entry.
+
+    Args:
+        operation_id: The unique identifier for this restore operation
+
+    Returns:
+        dict: The state object
+    """
+    entry = _STATE_CACHE.get(operation_id)
+    if entry and time.monotonic() - entry[0] < _STATE_CACHE_TTL:
+        return entry[1]
+
+    state = load_state(operation_id)
+    _STATE_CACHE[operation_id] = (time.monotonic(), state)
+    return state
+
+def _invalidate_state_cache(operation_id: str) -> None:
+    """Drop the cached read for an operation after a write."""
+    _STATE_CACHE.pop(operation_id, None)
+
 def save_state(operation_id: str, state: Dict[str, Any]) -> bool:
     """
     Save state to DynamoDB.
-    
+
+    Writers build their state dicts from scratch rather than
+    read-modify-write, so last-write-wins PutItem is the correct
+    semantics here; a conditional version check would reject every
+    write after the first.
+
     Args:
         operation_id: The unique identifier for this restore operation
         state: The state object to save
-        
+
     Returns:
         bool: True if successful
     """
     try:
-        # Ensure operation_id is in the state
+        state = dict(state)
         state['operation_id'] = operation_id
-        
+
         # Add timestamp if not present
         if 'timestamp' not in state:
             state['timestamp'] = int(time.time())
-            
-        state_table.put_item(Item=state)
+
+        _get_table(STATE_TABLE_NAME).put_item(Item=state)
+
+        _invalidate_state_cache(operation_id)
         return True
     except Exception as e:
         logger.error(f"Error saving state: {str(e)}", exc_info=True)
         return False
 
+def delete_state(operation_id: str) -> bool:
+    """
+    Delete the state item for an operation.
+
+    The state table is keyed on operation_id alone, so this is a single
+    DeleteItem call. Audit items are left to their 30-day TTL.
+
+    Args:
+        operation_id: The unique identifier for this restore operation
+
+    Returns:
+        bool: True if successful
+    """
+    try:
+        _get_table(STATE_TABLE_NAME).delete_item(
+            Key={'operation_id': operation_id}
+        )
+
+        _invalidate_state_cache(operation_id)
+        return True
+    except Exception as e:
+        logger.error(f"Error deleting state: {str(e)}", exc_info=True)
+        return False
+
 def log_audit_event(operation_id: str = "", event_type: str = "", status: str = "success", details: Dict[str, Any] = None) -> bool:
     """
     Log audit event to DynamoDB.
@@ -144,13 +182,116 @@ def log_audit_event(operation_id: str = "", event_type: str = "", status: str =
         if operation_id:
             item['operation_id'] = operation_id
             
-        audit_table.put_item(Item=item)
+        _get_table(AUDIT_TABLE_NAME).put_item(Item=item)
         logger.info(f"Logged audit event: {event_type} - {status}")
         return True
     except Exception as e:
         logger.error(f"Error logging audit event: {str(e)}", exc_info=True)
         return False
 
+def persist_state_and_audit(operation_id: str, event_type: str, state: Dict[str, Any], status: str = "success", details: Dict[str, Any] = None) -> bool:
+    """
+    Persist state and an audit event in a single DynamoDB transaction.
+
+    Replaces the sequential save_state + log_audit_event round-trips with
+    one TransactWriteItems call: same bytes written, one network round-trip.
+
+    Args:
+        operation_id: The unique identifier for this restore operation
+        event_type: The type of event (usually the step name)
+        state: The state object to save
+        status: The status of the audit event
+        details: Additional details about the event
+
+    Returns:
+        bool: True if successful
+    """
+    if details is None:
+        details = {}
+
+    try:
+        from boto3.dynamodb.types import TypeSerializer
+        serializer = TypeSerializer()
+
+        state = dict(state)
+        state['operation_id'] = operation_id
+        # Record the writing step on the item so every persist path
+        # produces the same shape; operation_id alone remains the key
+        state.setdefault('step', event_type)
+        if 'timestamp' not in state:
+            state['timestamp'] = int(time.time())
+
+        timestamp = datetime.now().isoformat()
+        audit_item = {
+            'event_id': f"{event_type}_{timestamp}",
+            'event_type': event_type,
+            'status': status,
+            'timestamp': timestamp,
+            'details': json.dumps(details),
+            'environment': ENVIRONMENT,
+            'ttl': int(time.time()) + (30 * 24 * 60 * 60),  # 30 days TTL
+            'operation_id': operation_id
+        }
+
+        _get_table(STATE_TABLE_NAME).meta.client.transact_write_items(
+            TransactItems=[
+                {
+                    'Put': {
+                        'TableName': STATE_TABLE_NAME,
+                        'Item': {k: serializer.serialize(v) for k, v in state.items()}
+                    }
+                },
+                {
+                    'Put': {
+                        'TableName': AUDIT_TABLE_NAME,
+                        'Item': {k: serializer.serialize(v) for k, v in audit_item.items()}
+                    }
+                }
+            ]
+        )
+        _invalidate_state_cache(operation_id)
+        return True
+    except Exception as e:
+        logger.error(f"Error persisting state and audit event: {str(e)}", exc_info=True)
+        return False
+
+def emit_metric(operation_id: str, metric_name: str, value: float, unit: str = "Count") -> bool:
+    """
+    Emit a CloudWatch metric via Embedded Metric Format.
+
+    The metric rides on a single stdout log line that CloudWatch Logs
+    extracts into a metric, so no PutMetricData round-trip is paid.
+
+    Args:
+        operation_id: The unique identifier for this restore operation
+        metric_name: The name of the metric
+        value: The value of the metric
+        unit: The unit of the metric
+
+    Returns:
+        bool: True if successful
+    """
+    try:
+        print(json.dumps({
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [
+                    {
+                        'Namespace': 'AuroraRestore',
+                        'Dimensions': [['OperationId', 'Environment']],
+                        'Metrics': [{'Name': metric_name, 'Unit': unit}]
+                    }
+                ]
+            },
+            'OperationId': operation_id,
+            'Environment': ENVIRONMENT,
+            metric_name: value
+        }))
+        return True
+    except Exception as e:
+        logger.error(f"Error emitting metric: {str(e)}", exc_info=True)
+        return False
+
 def update_metrics(operation_id: str, metric_name: str, value: float, unit: str = "Count") -> bool:
     """
     Update CloudWatch metrics for monitoring.
@@ -5,10 +5,23 @@ This module provides standardized validation functions for inputs and configurat
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 from utils.core import get_config
 
+# AWS region format: us-east-1, eu-west-1, etc. Compiled once at import so
+# per-invocation validation is a single match call.
+_REGION_RE = re.compile(r'^[a-z]{2}-[a-z]+-\d{1}$')
+
+# Snapshot names/IDs: first character alphanumeric, then alphanumerics or
+# hyphens, at most 255 characters total.
+_SNAPSHOT_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9-]{0,254}$')
+
+# Cluster IDs: first character alphanumeric, then alphanumerics or
+# hyphens, at most 63 characters total.
+_CLUSTER_RE = re.compile(r'^[a-zA-Z0-9][a-zA-Z0-9-]{0,62}$')
+
 def validate_required_params(params: Dict[str, Any]) -> List[str]:
     """
     Validate that required parameters are present and not empty.
@@ -25,22 +38,24 @@ def validate_required_params(params: Dict[str, Any]) -> List[str]:
             missing.append(key)
     return missing
 
+@lru_cache(maxsize=64)
 def validate_region(region: str) -> bool:
     """
     Validate AWS region format.
-    
+
+    Deployments validate the same handful of region strings on every
+    invocation, so results are memoized per container.
+
     Args:
         region: Region to validate
-        
+
     Returns:
         bool: True if valid, False otherwise
     """
     if not region:
         return False
-    
-    # AWS region format: us-east-1, eu-west-1, etc.
-    pattern = r'^[a-z]{2}-[a-z]+-\d{1}$'
-    return bool(re.match(pattern, region))
+
+    return bool(_REGION_RE.match(region))
 
 def validate_cluster_id(cluster_id: str) -> bool:
     """
@@ -54,15 +69,8 @@ def validate_cluster_id(cluster_id: str) -> bool:
     """
     if not cluster_id:
         return False
-    
-    if len(cluster_id) > 63:
-        return False
-    
-    if not cluster_id[0].isalnum():
-        return False
-    
-    valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
-    return all(c in valid_chars for c in cluster_id)
+
+    return bool(_CLUSTER_RE.match(cluster_id))
 
 def validate_snapshot_id(snapshot_id: str) -> bool:
     """
@@ -76,15 +84,8 @@ def validate_snapshot_id(snapshot_id: str) -> bool:
     """
     if not snapshot_id:
         return False
-    
-    if len(snapshot_id) > 255:
-        return False
-    
-    if not snapshot_id[0].isalnum():
-        return False
-    
-    valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
-    return all(c in valid_chars for c in snapshot_id)
+
+    return bool(_SNAPSHOT_RE.match(snapshot_id))
 
 def validate_snapshot_name(snapshot_name: str) -> bool:
     """
@@ -98,15 +99,8 @@ def validate_snapshot_name(snapshot_name: str) -> bool:
     """
     if not snapshot_name:
         return False
-    
-    if len(snapshot_name) > 255:
-        return False
-    
-    if not snapshot_name[0].isalnum():
-        return False
-    
-    valid_chars = set('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-')
-    return all(c in valid_chars for c in snapshot_name)
+
+    return bool(_SNAPSHOT_RE.match(snapshot_name))
 
 def validate_vpc_config(vpc_id: str, subnet_ids: List[str], security_group_ids: List[str]) -> bool:
     """